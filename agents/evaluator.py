@@ -6,16 +6,45 @@ the quality, completeness, and relevance of generated briefs against the origina
 """
 import re
 import logging
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from core.caching import short_text_cache
 from core.types import EvaluationResult, BriefOutput
-from tools.summarizer import Summarizer
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Precompiled pattern and translation table used on every evaluation
+_WORD_RE = re.compile(r'\b\w+\b')
+# Folds all sentence terminators into '.' so splitting needs no regex
+_SENT_TABLE = str.maketrans('!?', '..')
+
+# Weights of each score component in the overall score
+_WEIGHTS = {
+    "length": 0.2,
+    "sections": 0.3,
+    "references": 0.2,
+    "coverage": 0.2,
+    "readability": 0.1
+}
+_WEIGHT_SUM_FULL = sum(_WEIGHTS.values())
+
+@short_text_cache(maxsize=256)
+def _tokenize_query(query: str) -> FrozenSet[str]:
+    """Lowercased word set of a query, memoized across evaluator calls."""
+    return frozenset(_WORD_RE.findall(query.lower()))
+
+@short_text_cache(maxsize=256)
+def _tokenize_query_filtered(query: str) -> FrozenSet[str]:
+    """Query words longer than three characters, used for improvement suggestions."""
+    return frozenset(term for term in _tokenize_query(query) if len(term) > 3)
+
+def _tokenize_content(content_lower: str) -> FrozenSet[str]:
+    """Word set of already-lowercased content."""
+    return frozenset(_WORD_RE.findall(content_lower))
+
+@dataclass(slots=True, frozen=True)
 class EvaluationCriteria:
     """Criteria for evaluating brief quality."""
     min_length: int = 100
@@ -26,6 +55,12 @@ class EvaluationCriteria:
     min_coverage: float = 0.7  # Minimum coverage of query terms
     max_avg_sentence_length: int = 25
     max_readability_score: float = 14.0  # Flesch-Kincaid grade level
+    required_sections_lower: Tuple[str, ...] = field(init=False)  # Lowercased once at parse time
+    
+    def __post_init__(self):
+        """Precompute the lowercased section names."""
+        sections_lower = tuple(section.lower() for section in self.required_sections or ())
+        object.__setattr__(self, "required_sections_lower", sections_lower)
 
 class Evaluator:
     """
@@ -43,7 +78,6 @@ class Evaluator:
             criteria: Optional dictionary of criteria overrides
         """
         self.criteria = self._parse_criteria(criteria or {})
-        self.summarizer = Summarizer()
     
     def _parse_criteria(self, criteria: Dict[str, Any]) -> EvaluationCriteria:
         """
@@ -67,6 +101,26 @@ class Evaluator:
             max_readability_score=criteria.get("max_readability_score", 14.0)
         )
     
+    def _text_stats(self, content: str) -> Tuple[int, int, float]:
+        """
+        Count sentences and words in a single pass over the content.
+        
+        Args:
+            content: The text to analyze
+            
+        Returns:
+            Tuple of (sentence count, word count, average sentence length)
+        """
+        num_sentences = 0
+        num_words = 0
+        for sentence in content.translate(_SENT_TABLE).split('.'):
+            if sentence.strip():
+                num_sentences += 1
+                num_words += len(sentence.split())
+        
+        avg_sentence_length = num_words / num_sentences if num_sentences else 0.0
+        return num_sentences, num_words, avg_sentence_length
+    
     def evaluate_brief(
         self,
         brief: BriefOutput,
@@ -91,85 +145,84 @@ class Evaluator:
                 score=0.0
             )
         
+        criteria = self.criteria
+        
         # Initialize feedback and score components
         feedback = []
         score_components = {}
         
         # 1. Check brief length
         content_length = len(brief.content)
-        if content_length < self.criteria.min_length:
-            feedback.append(f"Brief is too short ({content_length} chars, minimum {self.criteria.min_length} required).")
+        if content_length < criteria.min_length:
+            feedback.append(f"Brief is too short ({content_length} chars, minimum {criteria.min_length} required).")
             score_components["length"] = 0.0
-        elif content_length > self.criteria.max_length:
-            feedback.append(f"Brief is too long ({content_length} chars, maximum {self.criteria.max_length} allowed).")
+        elif content_length > criteria.max_length:
+            feedback.append(f"Brief is too long ({content_length} chars, maximum {criteria.max_length} allowed).")
             score_components["length"] = 0.5
         else:
             score_components["length"] = 1.0
         
         # 2. Check for required sections
-        missing_sections = []
         content_lower = brief.content.lower()
-        for section in self.criteria.required_sections:
-            if section.lower() not in content_lower:
-                missing_sections.append(section)
+        missing_sections = [
+            section for section, term in zip(
+                criteria.required_sections,
+                criteria.required_sections_lower
+            )
+            if term not in content_lower
+        ]
         
         if missing_sections:
             feedback.append(f"Missing required sections: {', '.join(missing_sections)}")
-            score_components["sections"] = 0.5 if len(missing_sections) < len(self.criteria.required_sections) else 0.0
+            score_components["sections"] = 0.5 if len(missing_sections) < len(criteria.required_sections) else 0.0
         else:
             score_components["sections"] = 1.0
         
         # 3. Check references
         num_references = len(brief.references) if brief.references else 0
-        if num_references < self.criteria.min_references:
-            feedback.append(f"Insufficient references ({num_references}, minimum {self.criteria.min_references} required).")
+        if num_references < criteria.min_references:
+            feedback.append(f"Insufficient references ({num_references}, minimum {criteria.min_references} required).")
             score_components["references"] = 0.0
-        elif num_references > self.criteria.max_references:
-            feedback.append(f"Too many references ({num_references}, maximum {self.criteria.max_references} allowed).")
+        elif num_references > criteria.max_references:
+            feedback.append(f"Too many references ({num_references}, maximum {criteria.max_references} allowed).")
             score_components["references"] = 0.5
         else:
             score_components["references"] = 1.0
         
         # 4. Check query term coverage
-        query_terms = set(term.lower() for term in re.findall(r'\b\w+\b', original_query))
+        query_terms = _tokenize_query(original_query)
+        content_terms = None
         if query_terms:
-            covered_terms = sum(1 for term in query_terms if term in content_lower)
+            content_terms = _tokenize_content(content_lower)
+            covered_terms = len(query_terms & content_terms)
             coverage = covered_terms / len(query_terms)
-            if coverage < self.criteria.min_coverage:
-                feedback.append(f"Low query term coverage ({coverage:.1%}, minimum {self.criteria.min_coverage:.0%} required).")
-                score_components["coverage"] = coverage / self.criteria.min_coverage  # Normalized score
+            if coverage < criteria.min_coverage:
+                feedback.append(f"Low query term coverage ({coverage:.1%}, minimum {criteria.min_coverage:.0%} required).")
+                score_components["coverage"] = coverage / criteria.min_coverage  # Normalized score
             else:
                 score_components["coverage"] = 1.0
         
         # 5. Check readability (simplified)
-        sentences = [s for s in re.split(r'[.!?]', brief.content) if s.strip()]
-        if sentences:
-            words = [word for sent in sentences for word in sent.split()]
-            avg_sentence_length = len(words) / len(sentences) if sentences else 0
-            if avg_sentence_length > self.criteria.max_avg_sentence_length:
-                feedback.append(f"Average sentence length is too high ({avg_sentence_length:.1f} words, maximum {self.criteria.max_avg_sentence_length} recommended).")
+        text_stats = self._text_stats(brief.content)
+        num_sentences, _, avg_sentence_length = text_stats
+        if num_sentences:
+            if avg_sentence_length > criteria.max_avg_sentence_length:
+                feedback.append(f"Average sentence length is too high ({avg_sentence_length:.1f} words, maximum {criteria.max_avg_sentence_length} recommended).")
                 score_components["readability"] = 0.5
             else:
                 score_components["readability"] = 1.0
         
-        # Calculate overall score (weighted average)
-        weights = {
-            "length": 0.2,
-            "sections": 0.3,
-            "references": 0.2,
-            "coverage": 0.2,
-            "readability": 0.1
-        }
-        
-        # Calculate weighted score
-        total_weight = sum(weights.get(k, 0) for k in score_components)
-        if total_weight > 0:
-            weighted_score = sum(
-                score * weights.get(metric, 0)
-                for metric, score in score_components.items()
-            ) / total_weight
+        # Calculate overall score (weighted average). Coverage and readability
+        # are skipped for empty queries/content, so only then re-sum the weights.
+        weighted_sum = sum(
+            score * _WEIGHTS[metric]
+            for metric, score in score_components.items()
+        )
+        if len(score_components) == len(_WEIGHTS):
+            total_weight = _WEIGHT_SUM_FULL
         else:
-            weighted_score = 0.0
+            total_weight = sum(_WEIGHTS[metric] for metric in score_components)
+        weighted_score = weighted_sum / total_weight if total_weight > 0 else 0.0
         
         # Determine if brief is complete
         is_complete = all(
@@ -187,11 +240,14 @@ class Evaluator:
             for metric, score in sorted(score_components.items())
         ))
         
-        return EvaluationResult(
+        result = EvaluationResult(
             is_complete=is_complete,
             feedback="\n".join(feedback),
             score=weighted_score
         )
+        result._text_stats = text_stats
+        result._content_terms = content_terms
+        return result
     
     def generate_improvement_suggestions(
         self,
@@ -228,8 +284,11 @@ class Evaluator:
         # Check for missing sections
         content_lower = brief.content.lower()
         missing_sections = [
-            section for section in self.criteria.required_sections
-            if section.lower() not in content_lower
+            section for section, term in zip(
+                self.criteria.required_sections,
+                self.criteria.required_sections_lower
+            )
+            if term not in content_lower
         ]
         
         for section in missing_sections:
@@ -246,23 +305,23 @@ class Evaluator:
             )
         
         # Check query coverage
-        query_terms = set(term.lower() for term in re.findall(r'\b\w+\b', original_query) if len(term) > 3)
+        query_terms = _tokenize_query_filtered(original_query)
         if query_terms:
-            content_terms = set(re.findall(r'\b\w+\b', brief.content.lower()))
-            missing_terms = [term for term in query_terms if term not in content_terms]
+            content_terms = evaluation._content_terms
+            if content_terms is None:
+                content_terms = _tokenize_content(content_lower)
+            missing_terms = query_terms - content_terms
             
             if missing_terms and len(missing_terms) < 5:  # Only suggest if a few terms are missing
                 suggestions.append(
                     f"Consider addressing these key terms from the query: "
-                    f"{', '.join(missing_terms)}."
+                    f"{', '.join(sorted(missing_terms))}."
                 )
         
         # Check readability
-        sentences = [s for s in re.split(r'[.!?]', brief.content) if s.strip()]
-        if sentences:
-            words = [word for sent in sentences for word in sent.split()]
-            avg_sentence_length = len(words) / len(sentences) if sentences else 0
-            
+        text_stats = evaluation._text_stats or self._text_stats(brief.content)
+        num_sentences, _, avg_sentence_length = text_stats
+        if num_sentences:
             if avg_sentence_length > self.criteria.max_avg_sentence_length:
                 suggestions.append(
                     "Break down long sentences into shorter ones to improve readability. "
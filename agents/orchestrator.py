@@ -6,7 +6,8 @@ of different workers based on the user's query and manages the overall workflow.
 """
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from typing import AsyncIterator, Awaitable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -14,9 +15,11 @@ from core.types import (
     WorkerType,
     WorkerResult,
     ExecutionPlan,
+    EvaluationResult,
     BriefOutput,
     APIResponse,
-    APIRequest
+    APIRequest,
+    StreamEvent
 )
 from agents.router import Router
 from agents.evaluator import Evaluator
@@ -25,6 +28,9 @@ from tools.summarizer import Summarizer
 
 logger = logging.getLogger(__name__)
 
+# Section headings for each worker type, e.g. WEB_SEARCH -> "Web Search"
+_WORKER_TITLES = {wt: wt.value.replace('_', ' ').title() for wt in WorkerType}
+
 @dataclass
 class WorkerConfig:
     """Configuration for worker initialization."""
@@ -49,7 +55,8 @@ class Orchestrator:
         self.config = config or {}
         self.router = Router()
         self.evaluator = Evaluator()
-        self.summarizer = Summarizer()
+        self._summarizer: Optional[Summarizer] = None
+        self._summarizer_lock = threading.Lock()
         
         # Initialize workers
         self.workers = {
@@ -65,6 +72,21 @@ class Orchestrator:
             # Add other workers here as needed
         }
     
+    @property
+    def summarizer(self) -> Summarizer:
+        """
+        Summarizer, created on first use since most briefs never need one.
+        
+        Creating it may download NLTK data, so only read this off the event
+        loop; the lock keeps the warm-up thread and a request from building
+        two summarizers (and running two downloads) at once.
+        """
+        if self._summarizer is None:
+            with self._summarizer_lock:
+                if self._summarizer is None:
+                    self._summarizer = Summarizer()
+        return self._summarizer
+    
     async def process_request(self, request: APIRequest) -> APIResponse:
         """
         Process an API request and generate a response.
@@ -85,53 +107,173 @@ class Orchestrator:
             # Step 2: Execute workers in parallel
             worker_results = await self._execute_workers(plan)
             
-            # Step 3: Aggregate and process results
-            brief = await self._generate_brief(
-                query=request.query,
-                worker_results=worker_results
-            )
+            # Steps 3-5: Aggregate, evaluate and optimize the brief
+            brief, evaluation = await self._build_brief(request.query, worker_results)
             
-            # Step 4: Evaluate the brief
-            evaluation = self.evaluator.evaluate_brief(
-                brief=brief,
-                original_query=request.query
+            # Prepare response
+            return self._build_response(brief, evaluation, worker_results)
+            
+        except Exception as e:
+            logger.error(f"Error processing request: {str(e)}", exc_info=True)
+            return APIResponse(
+                success=False,
+                error=f"Failed to process request: {str(e)}"
             )
+    
+    async def process_request_stream(self, request: APIRequest) -> AsyncIterator[StreamEvent]:
+        """
+        Process an API request, yielding events as the workflow progresses.
+        
+        Emits a ``plan`` event, one ``worker`` event per worker as it finishes,
+        and a final ``result`` event carrying the same APIResponse that
+        process_request would return.
+        
+        Args:
+            request: The API request containing the user query
             
-            # Step 5: Optimize if needed
-            if not evaluation.is_complete and evaluation.score < 0.7:
-                logger.info("Brief evaluation failed, attempting to improve...")
-                improved_brief = await self._optimize_brief(
-                    brief=brief,
-                    evaluation=evaluation,
-                    original_query=request.query,
-                    worker_results=worker_results
-                )
-                
-                if improved_brief:
-                    brief = improved_brief
-                    evaluation = self.evaluator.evaluate_brief(
-                        brief=brief,
-                        original_query=request.query
-                    )
+        Yields:
+            StreamEvent for each step of the workflow
+        """
+        tasks: Dict[asyncio.Future, WorkerType] = {}
+        try:
+            logger.info(f"Processing streaming request: {request.query}")
             
-            # Prepare response
-            return APIResponse(
-                success=True,
-                brief=brief,
-                metadata={
-                    "evaluation_score": evaluation.score,
-                    "is_complete": evaluation.is_complete,
-                    "worker_count": len(worker_results),
-                    "generated_at": datetime.utcnow().isoformat()
+            # Step 1: Create execution plan
+            plan = self._create_execution_plan(request.query)
+            yield StreamEvent(
+                event="plan",
+                data={
+                    "required_workers": [wt.value for wt in plan.required_workers],
+                    "context": plan.context
                 }
             )
             
+            # Step 2: Execute workers in parallel, reporting each as it completes
+            tasks = {
+                asyncio.ensure_future(coro): worker_type
+                for worker_type, coro in self._worker_coroutines(plan)
+            }
+            completed: Dict[WorkerType, WorkerResult] = {}
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    worker_type = tasks[task]
+                    # exception() raises CancelledError on a cancelled task
+                    error: Optional[BaseException]
+                    if task.cancelled():
+                        error = asyncio.CancelledError(f"Worker {worker_type} was cancelled")
+                    else:
+                        error = task.exception()
+                    if error is None:
+                        completed[worker_type] = task.result()
+                    yield StreamEvent(
+                        event="worker",
+                        data={
+                            "worker": worker_type.value,
+                            "success": error is None,
+                            "error": str(error) if error else None
+                        }
+                    )
+            
+            # Keep plan order so the brief matches process_request
+            worker_results = {
+                worker_type: completed[worker_type]
+                for worker_type in tasks.values()
+                if worker_type in completed
+            }
+            
+            # Steps 3-5: Aggregate, evaluate and optimize the brief
+            brief, evaluation = await self._build_brief(request.query, worker_results)
+            response = self._build_response(brief, evaluation, worker_results)
+            
         except Exception as e:
-            logger.error(f"Error processing request: {str(e)}", exc_info=True)
-            return APIResponse(
+            logger.error(f"Error processing streaming request: {str(e)}", exc_info=True)
+            response = APIResponse(
                 success=False,
                 error=f"Failed to process request: {str(e)}"
             )
+        finally:
+            # Don't leave workers running if the client went away
+            for task in tasks:
+                task.cancel()
+        
+        yield StreamEvent(event="result", data=response.model_dump())
+    
+    async def _build_brief(
+        self,
+        query: str,
+        worker_results: Dict[WorkerType, WorkerResult]
+    ) -> Tuple[BriefOutput, EvaluationResult]:
+        """
+        Generate, evaluate and (if needed) optimize a brief.
+        
+        Args:
+            query: The original user query
+            worker_results: Dictionary of worker results
+            
+        Returns:
+            Tuple of the final brief and its evaluation
+        """
+        # Step 3: Aggregate and process results
+        brief = await self._generate_brief(
+            query=query,
+            worker_results=worker_results
+        )
+        
+        # Step 4: Evaluate the brief
+        evaluation = self.evaluator.evaluate_brief(
+            brief=brief,
+            original_query=query
+        )
+        
+        # Step 5: Optimize if needed
+        if not evaluation.is_complete and evaluation.score < 0.7:
+            logger.info("Brief evaluation failed, attempting to improve...")
+            improved_brief = await self._optimize_brief(
+                brief=brief,
+                evaluation=evaluation,
+                original_query=query,
+                worker_results=worker_results
+            )
+            
+            if improved_brief:
+                brief = improved_brief
+                evaluation = self.evaluator.evaluate_brief(
+                    brief=brief,
+                    original_query=query
+                )
+        
+        return brief, evaluation
+    
+    def _build_response(
+        self,
+        brief: BriefOutput,
+        evaluation: EvaluationResult,
+        worker_results: Dict[WorkerType, WorkerResult]
+    ) -> APIResponse:
+        """
+        Build the successful API response for a brief.
+        
+        Args:
+            brief: The final brief
+            evaluation: The brief's evaluation
+            worker_results: Dictionary of worker results
+            
+        Returns:
+            APIResponse containing the brief
+        """
+        # Built from already-validated models, so skip re-validation
+        return APIResponse.model_construct(
+            success=True,
+            brief=brief,
+            metadata={
+                "evaluation_score": evaluation.score,
+                "is_complete": evaluation.is_complete,
+                "worker_count": len(worker_results),
+                "generated_at": datetime.utcnow().isoformat()
+            }
+        )
     
     def _create_execution_plan(self, query: str) -> ExecutionPlan:
         """
@@ -146,6 +288,25 @@ class Orchestrator:
         plan_data = self.router.create_execution_plan(query)
         return ExecutionPlan(**plan_data)
     
+    def _worker_coroutines(
+        self,
+        plan: ExecutionPlan
+    ) -> List[Tuple[WorkerType, Awaitable[WorkerResult]]]:
+        """
+        Create an execution coroutine for each registered worker in the plan.
+        
+        Args:
+            plan: The execution plan
+            
+        Returns:
+            List of (worker type, coroutine) pairs
+        """
+        return [
+            (worker_type, self._execute_worker(self.worker_registry[worker_type], worker_type, plan))
+            for worker_type in plan.required_workers
+            if worker_type in self.worker_registry
+        ]
+    
     async def _execute_workers(
         self,
         plan: ExecutionPlan
@@ -159,22 +320,17 @@ class Orchestrator:
         Returns:
             Dictionary mapping worker types to their results
         """
-        tasks = []
-        
-        # Create tasks for each required worker
-        for worker_type in plan.required_workers:
-            if worker_type in self.worker_registry:
-                worker = self.worker_registry[worker_type]
-                tasks.append(
-                    self._execute_worker(worker, worker_type, plan)
-                )
+        # Keep each worker type alongside its task so results line up even
+        # when some workers are unregistered
+        pairs = self._worker_coroutines(plan)
+        worker_types, tasks = zip(*pairs) if pairs else ((), ())
         
         # Execute all tasks in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Process results
         worker_results = {}
-        for worker_type, result in zip(plan.required_workers, results):
+        for worker_type, result in zip(worker_types, results):
             if isinstance(result, Exception):
                 logger.error(
                     f"Worker {worker_type} failed: {str(result)}",
@@ -235,13 +391,23 @@ class Orchestrator:
         Returns:
             A BriefOutput object containing the generated brief
         """
-        # Combine content from all workers
-        combined_content = []
+        # Combine content from all workers into a single buffer
+        buf: List[str] = []
+        buf_append = buf.append
+        total_len = 0
         references = []
         
         for worker_type, result in worker_results.items():
             if result and result.content:
-                combined_content.append(f"## {worker_type.value.replace('_', ' ').title()}\n{result.content}")
+                title = _WORKER_TITLES[worker_type]
+                if buf:
+                    buf_append("\n\n")
+                    total_len += 2
+                buf_append("## ")
+                buf_append(title)
+                buf_append("\n")
+                buf_append(result.content)
+                total_len += len(title) + len(result.content) + 4
                 
                 # Extract references if available
                 if hasattr(result, 'metadata') and isinstance(result.metadata, dict):
@@ -249,20 +415,14 @@ class Orchestrator:
                     if isinstance(refs, list):
                         references.extend(refs)
         
-        # Combine all content
-        full_content = "\n\n".join(combined_content)
-        
-        # Generate a summary if the content is too long
-        if len(full_content) > 2000:  # Arbitrary threshold
-            summary = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.summarizer.summarize,
-                full_content
-            )
+        # Generate a summary if the content is too long; the summarizer is
+        # resolved (possibly created) and joins the buffer off the event loop
+        if total_len > 2000:  # Arbitrary threshold
+            summary = await asyncio.to_thread(lambda: self.summarizer.summarize_iter(buf))
         else:
-            summary = full_content
+            summary = "".join(buf)
         
-        # Create the brief
+        # Create the brief; references come from worker output, so validate them
         return BriefOutput(
             title=f"Brief: {query[:50]}" + ("..." if len(query) > 50 else ""),
             content=summary,
@@ -313,7 +473,8 @@ class Orchestrator:
                 + "\n".join(f"- {suggestion}" for suggestion in suggestions[:3])
             )
             
-            return BriefOutput(
+            # Every field is a str or comes from the already-validated brief
+            return BriefOutput.model_construct(
                 title=brief.title,
                 content=improved_content,
                 references=brief.references,
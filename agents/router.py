@@ -6,11 +6,18 @@ intent and select the appropriate workers to handle the request.
 """
 import re
 import logging
-from typing import List, Dict, Any, Set
+from types import MappingProxyType
+from typing import List, Dict, Any, FrozenSet, Mapping, Optional, Tuple
 from enum import Enum
 
+from core.caching import short_text_cache
 from core.types import WorkerType, IntentType
 
+try:
+    import re2
+except ImportError:  # Optional dependency, fall back to per-intent stdlib regexes
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 # Define patterns for intent classification
@@ -29,6 +36,36 @@ INTENT_PATTERNS = {
     ],
 }
 
+def _compile_intent_set(intent_patterns: Dict[IntentType, List[str]]) -> Optional[Any]:
+    """
+    Compile the intent patterns into an RE2 set, if google-re2 is available.
+    
+    ``re2.Set`` matches every intent's alternation in one linear-time DFA
+    pass and reports the index of each one that matched.
+    """
+    if re2 is None:
+        return None
+    options = re2.Options()
+    options.case_sensitive = False
+    intent_set = re2.Set.SearchSet(options)
+    for patterns in intent_patterns.values():
+        intent_set.Add("|".join(f"(?:{pattern})" for pattern in patterns))
+    intent_set.Compile()
+    return intent_set
+
+# Per-intent compiled patterns, exposed read-only as Router.patterns
+_INTENT_REGEXES: Mapping[IntentType, Tuple["re.Pattern[str]", ...]] = MappingProxyType({
+    intent: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for intent, patterns in INTENT_PATTERNS.items()
+})
+# One compiled alternation per intent, used when google-re2 is unavailable
+_INTENT_ALTS: Tuple[Tuple[IntentType, "re.Pattern[str]"], ...] = tuple(
+    (intent, re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE))
+    for intent, patterns in INTENT_PATTERNS.items()
+)
+_INTENT_SET = _compile_intent_set(INTENT_PATTERNS)
+_INTENT_ORDER = tuple(INTENT_PATTERNS)
+
 # Map intents to workers
 INTENT_TO_WORKERS = {
     IntentType.RESEARCH: [WorkerType.WEB_SEARCH],
@@ -39,6 +76,37 @@ INTENT_TO_WORKERS = {
 # Default workers to include in all requests
 DEFAULT_WORKERS = [WorkerType.WEB_SEARCH]
 
+# Static resolve tables so worker selection is a set union
+_WORKERS_FOR: Dict[IntentType, FrozenSet[WorkerType]] = {
+    intent: frozenset(workers) for intent, workers in INTENT_TO_WORKERS.items()
+}
+_DEFAULT_WORKERS_FS: FrozenSet[WorkerType] = frozenset(DEFAULT_WORKERS)
+_NO_WORKERS: FrozenSet[WorkerType] = frozenset()
+# Declaration order, so plans don't depend on set iteration (PYTHONHASHSEED)
+_WORKER_ORDER: Dict[WorkerType, int] = {wt: i for i, wt in enumerate(WorkerType)}
+
+@short_text_cache(maxsize=2048)
+def _detect_intents(query: str) -> Tuple[IntentType, ...]:
+    """Detect the intents of a query; cached since routing is pure in the query."""
+    if _INTENT_SET is not None:
+        indices = _INTENT_SET.Match(query) or ()
+        matched_intents = tuple(_INTENT_ORDER[i] for i in sorted(indices))
+    else:
+        matched_intents = tuple(intent for intent, rx in _INTENT_ALTS if rx.search(query))
+    
+    # If no specific intent detected, default to RESEARCH
+    return matched_intents or (IntentType.RESEARCH,)
+
+@short_text_cache(maxsize=2048)
+def _select_workers(query: str) -> Tuple[WorkerType, ...]:
+    """Select the workers for a query's intents; cached alongside intent detection."""
+    # Get all workers for matched intents, falling back to the defaults
+    selected_workers = _NO_WORKERS.union(
+        *(_WORKERS_FOR.get(intent, _NO_WORKERS) for intent in _detect_intents(query))
+    ) or _DEFAULT_WORKERS_FS
+    
+    return tuple(sorted(selected_workers, key=_WORKER_ORDER.__getitem__))
+
 class Router:
     """
     Routes user queries to appropriate workers based on intent analysis.
@@ -47,13 +115,10 @@ class Router:
     a given query based on its content and intent.
     """
     
-    def __init__(self):
-        """Initialize the router with compiled regex patterns."""
-        self.patterns = {
-            intent: [re.compile(pattern, re.IGNORECASE) 
-                    for pattern in patterns]
-            for intent, patterns in INTENT_PATTERNS.items()
-        }
+    @property
+    def patterns(self) -> Mapping[IntentType, Tuple["re.Pattern[str]", ...]]:
+        """Compiled regex patterns for each intent (read-only, shared by all routers)."""
+        return _INTENT_REGEXES
     
     def detect_intent(self, query: str) -> List[IntentType]:
         """
@@ -65,18 +130,7 @@ class Router:
         Returns:
             List of detected intents, ordered by confidence
         """
-        query = query.lower()
-        matched_intents: Set[IntentType] = set()
-        
-        for intent, patterns in self.patterns.items():
-            if any(pattern.search(query) for pattern in patterns):
-                matched_intents.add(intent)
-        
-        # If no specific intent detected, default to RESEARCH
-        if not matched_intents:
-            return [IntentType.RESEARCH]
-            
-        return list(matched_intents)
+        return list(_detect_intents(query))
     
     def select_workers(self, query: str) -> List[WorkerType]:
         """
@@ -88,20 +142,26 @@ class Router:
         Returns:
             List of worker types that should handle this query
         """
+        workers, _ = self.select_workers_with_intents(query)
+        return workers
+    
+    def select_workers_with_intents(
+        self,
+        query: str
+    ) -> Tuple[List[WorkerType], List[IntentType]]:
+        """
+        Select appropriate workers and return the intents they were chosen for.
+        
+        Args:
+            query: The user's query string
+            
+        Returns:
+            Tuple of (worker types that should handle this query, detected intents)
+        """
         intents = self.detect_intent(query)
         logger.info(f"Detected intents: {[i.value for i in intents]}")
         
-        # Get all workers for matched intents
-        selected_workers: Set[WorkerType] = set()
-        for intent in intents:
-            selected_workers.update(INTENT_TO_WORKERS.get(intent, []))
-        
-        # Add default workers if no specific workers were selected
-        if not selected_workers:
-            selected_workers.update(DEFAULT_WORKERS)
-        
-        # Convert to list for deterministic ordering
-        return list(selected_workers)
+        return list(_select_workers(query)), intents
     
     def create_execution_plan(self, query: str) -> Dict[str, Any]:
         """
@@ -113,13 +173,13 @@ class Router:
         Returns:
             Dictionary containing the execution plan
         """
-        workers = self.select_workers(query)
+        workers, intents = self.select_workers_with_intents(query)
         
         return {
             "query": query,
             "required_workers": workers,
             "context": {
-                "intents": [intent.value for intent in self.detect_intent(query)],
+                "intents": [intent.value for intent in intents],
                 "source": "router"
             }
         }
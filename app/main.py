@@ -4,15 +4,19 @@ FastAPI application for the Agentic Research & Brief Generator.
 This module provides the main FastAPI application that exposes the agent's
 functionality as a REST API.
 """
+import asyncio
 import logging
+import os
 import uvicorn
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
 
 from core.types import APIRequest, APIResponse
 from agents.orchestrator import Orchestrator
+from tools.web_search_tool import close_shared_client
 
 # Configure logging
 logging.basicConfig(
@@ -39,41 +43,62 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global orchestrator instance
-_orchestrator = None
-
 class RunRequest(BaseModel):
     """Request model for the /run endpoint."""
     query: str
     max_workers: Optional[int] = 3
     timeout: Optional[int] = 30
 
+def _warm_jit(orchestrator: Orchestrator) -> None:
+    """
+    Create the orchestrator's summarizer (fetching NLTK data if missing) and
+    run one summary through the scoring kernel so Numba compiles (or loads
+    it from the on-disk cache) before the first request needs it.
+    
+    Args:
+        orchestrator: The orchestrator whose summarizer should be warmed
+    """
+    try:
+        summarizer = orchestrator.summarizer
+        # Needs more long-enough sentences than max_sentences to reach the kernel
+        config = summarizer.config
+        filler = " ".join(["research"] * config.min_sentence_length)
+        text = " ".join(f"Warm up {i} {filler}." for i in range(config.max_sentences + 2))
+        summarizer.summarize(text)
+        logger.info("Summarizer warmed up")
+    except Exception as e:
+        logger.warning(f"Summarizer warm-up failed: {str(e)}")
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the orchestrator when the application starts."""
-    global _orchestrator
     logger.info("Initializing orchestrator...")
-    _orchestrator = Orchestrator()
+    orchestrator = Orchestrator()
+    app.state.orchestrator = orchestrator
+    # Kept on app.state so the background task is not garbage collected
+    app.state.warm_task = asyncio.create_task(asyncio.to_thread(_warm_jit, orchestrator))
     logger.info("Orchestrator initialized")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources when the application shuts down."""
-    global _orchestrator
-    if _orchestrator:
+    orchestrator = getattr(app.state, "orchestrator", None)
+    if orchestrator:
         logger.info("Shutting down orchestrator...")
-        await _orchestrator.close()
-        _orchestrator = None
+        await orchestrator.close()
+        app.state.orchestrator = None
         logger.info("Orchestrator shut down")
+    await close_shared_client()
 
-async def get_orchestrator() -> Orchestrator:
-    """Dependency to get the orchestrator instance."""
-    if _orchestrator is None:
+async def get_orchestrator(request: Request) -> Orchestrator:
+    """Dependency to get the orchestrator instance from the app state."""
+    orchestrator = getattr(request.app.state, "orchestrator", None)
+    if orchestrator is None:
         raise HTTPException(
             status_code=500,
             detail="Orchestrator not initialized"
         )
-    return _orchestrator
+    return orchestrator
 
 @app.post("/run", response_model=APIResponse, tags=["API"])
 async def run(
@@ -95,8 +120,8 @@ async def run(
     try:
         logger.info(f"Processing query: {request.query}")
         
-        # Create API request
-        api_request = APIRequest(
+        # Create API request; fields were already validated by RunRequest
+        api_request = APIRequest.model_construct(
             query=request.query,
             metadata={
                 "max_workers": request.max_workers,
@@ -124,6 +149,43 @@ async def run(
             detail=f"Internal server error: {str(e)}"
         )
 
+@app.post("/run/stream", tags=["API"])
+async def run_stream(
+    request: RunRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+) -> StreamingResponse:
+    """
+    Process a research query, streaming progress as Server-Sent Events.
+    
+    Emits a ``plan`` event, a ``worker`` event as each worker finishes, and
+    a final ``result`` event with the same payload as the /run endpoint.
+    
+    Args:
+        request: The run request containing the query and optional parameters
+        
+    Returns:
+        StreamingResponse of ``text/event-stream`` events
+    """
+    logger.info(f"Streaming query: {request.query}")
+    api_request = APIRequest.model_construct(
+        query=request.query,
+        metadata={
+            "max_workers": request.max_workers,
+            "timeout": request.timeout
+        }
+    )
+    
+    async def event_stream():
+        async for event in orchestrator.process_request_stream(api_request):
+            yield f"data: {event.model_dump_json()}\n\n"
+    
+    # Ask proxies not to cache or buffer the stream
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 @app.get("/health", tags=["Health"])
 async def health_check() -> dict:
     """Health check endpoint."""
@@ -133,12 +195,23 @@ async def health_check() -> dict:
     }
 
 def start():
-    """Start the FastAPI server with uvicorn."""
+    """
+    Start the FastAPI server with uvicorn.
+    
+    Runs one worker process per CPU (override with WEB_CONCURRENCY), using
+    uvloop and httptools when they are installed. Each process keeps its own
+    caches and warms its own JIT kernel. Set DEV=1 for a single
+    auto-reloading process instead.
+    """
+    dev = os.environ.get("DEV", "") == "1"
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=1 if dev else int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="auto",
+        http="auto",
+        reload=dev,
         log_level="info"
     )
 
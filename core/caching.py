@@ -0,0 +1,47 @@
+"""
+Caching helpers shared across the application.
+
+Routing and evaluation memoize their work per query string. Queries come
+straight from request bodies with no length limit, so these caches only
+keep short strings and compute longer ones afresh.
+"""
+from functools import lru_cache, wraps
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+# Longest string kept as a cache key
+MAX_CACHED_TEXT_LENGTH = 1024
+
+def short_text_cache(
+    maxsize: int,
+    max_length: int = MAX_CACHED_TEXT_LENGTH
+) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
+    """
+    LRU-cache a single-string function, but only for short arguments.
+
+    Bounds the cache's memory at roughly ``maxsize * max_length`` characters;
+    longer arguments call the function directly. The wrapper keeps
+    ``cache_clear`` and ``cache_info`` from ``functools.lru_cache``.
+
+    Args:
+        maxsize: Maximum number of cached results
+        max_length: Longest argument that is cached
+
+    Returns:
+        Decorator applying the bounded cache
+    """
+    def decorator(func: Callable[[str], T]) -> Callable[[str], T]:
+        cached = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(text: str) -> T:
+            if len(text) > max_length:
+                return func(text)
+            return cached(text)
+
+        wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+        wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
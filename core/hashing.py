@@ -0,0 +1,27 @@
+"""
+Hashing helpers shared across the application.
+
+Python's built-in ``hash()`` for strings is salted per process, so anything
+that must agree across processes (e.g. uvicorn workers) uses these instead.
+"""
+import hashlib
+
+try:
+    import xxhash
+except ImportError:  # Optional dependency, fall back to hashlib's blake2b
+    xxhash = None
+
+def stable_hash(text: str) -> int:
+    """
+    Hash text to a 64-bit integer that is identical in every process.
+    
+    Args:
+        text: The text to hash
+        
+    Returns:
+        Unsigned 64-bit hash of the text's UTF-8 encoding
+    """
+    data = text.encode("utf-8", "surrogatepass")
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
@@ -1,7 +1,7 @@
 from enum import Enum, auto
-from typing import Dict, List, Optional, TypedDict, Union, Literal
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, TypedDict, Union, Literal
 from dataclasses import dataclass
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class WorkerType(str, Enum):
@@ -21,7 +21,7 @@ class IntentType(str, Enum):
 class WorkerResult(BaseModel):
     """Result from a worker's execution."""
     content: str
-    metadata: Dict[str, Union[str, int, float, bool, None]] = {}
+    metadata: Dict[str, Any] = {}
     source: str
 
 
@@ -30,13 +30,17 @@ class EvaluationResult(BaseModel):
     is_complete: bool
     feedback: str
     score: float  # 0.0 to 1.0
+    # (sentence count, word count, avg sentence length) of the evaluated brief
+    _text_stats: Optional[Tuple[int, int, float]] = PrivateAttr(default=None)
+    # Lowercased word set of the evaluated brief, reused by the optimizer
+    _content_terms: Optional[FrozenSet[str]] = PrivateAttr(default=None)
 
 
 class ExecutionPlan(BaseModel):
     """Plan for executing a query."""
     query: str
     required_workers: List[WorkerType]
-    context: Dict[str, str] = {}
+    context: Dict[str, Any] = {}
 
 
 class BriefOutput(BaseModel):
@@ -66,6 +70,7 @@ class WorkerResponse:
 class APIRequest(BaseModel):
     """Request model for the API endpoint."""
     query: str
+    metadata: Dict[str, Union[str, int, float, bool, None]] = {}
 
 
 class APIResponse(BaseModel):
@@ -73,3 +78,10 @@ class APIResponse(BaseModel):
     success: bool
     brief: Optional[BriefOutput] = None
     error: Optional[str] = None
+    metadata: Dict[str, Any] = {}
+
+
+class StreamEvent(BaseModel):
+    """Event emitted by the streaming API endpoint."""
+    event: Literal["plan", "worker", "result"]
+    data: Dict[str, Any] = {}
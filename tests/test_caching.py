@@ -0,0 +1,39 @@
+"""Tests for the bounded query caches."""
+from core.caching import short_text_cache
+
+
+def _counting(max_length):
+    calls = []
+
+    @short_text_cache(maxsize=8, max_length=max_length)
+    def upper(text: str) -> str:
+        calls.append(text)
+        return text.upper()
+
+    return upper, calls
+
+
+def test_short_text_is_computed_once():
+    upper, calls = _counting(max_length=5)
+
+    assert upper("abc") == upper("abc") == "ABC"
+    assert calls == ["abc"]
+    assert upper.cache_info().currsize == 1
+
+
+def test_long_text_is_computed_every_time_and_never_cached():
+    upper, calls = _counting(max_length=5)
+
+    assert upper("abcdef") == upper("abcdef") == "ABCDEF"
+    assert calls == ["abcdef", "abcdef"]
+    assert upper.cache_info().currsize == 0
+
+
+def test_cache_clear_empties_the_cache():
+    upper, calls = _counting(max_length=5)
+    upper("abc")
+
+    upper.cache_clear()
+    upper("abc")
+
+    assert calls == ["abc", "abc"]
@@ -0,0 +1,71 @@
+"""Tests for brief evaluation and improvement suggestions."""
+import pytest
+
+from agents.evaluator import Evaluator, _WEIGHTS
+from core.types import BriefOutput, EvaluationResult
+
+_SECTIONS = "Introduction: text. Key_points: more text. Conclusion: done."
+_REFERENCES = [{"title": "Ref", "url": "https://example.com"}]
+
+
+def _brief(content: str, references=_REFERENCES) -> BriefOutput:
+    return BriefOutput(title="Brief", content=content, references=references, generated_at="now")
+
+
+def _breakdown(result: EvaluationResult) -> dict:
+    """Parse the "- metric: score" lines of the feedback's score breakdown."""
+    lines = result.feedback.split("Score Breakdown:")[1].strip().splitlines()
+    return {line[2:].split(":")[0]: float(line.split(":")[1]) for line in lines}
+
+
+@pytest.mark.parametrize("content, coverage", [
+    ("Experts said the market moved. " * 5 + _SECTIONS, 0.0),
+    ("AI moved the market. " * 5 + _SECTIONS, 1.0),
+])
+def test_coverage_matches_whole_words_only(content, coverage):
+    result = Evaluator({"min_coverage": 1.0}).evaluate_brief(_brief(content), "AI")
+
+    assert _breakdown(result)["coverage"] == coverage
+
+
+def test_empty_query_drops_coverage_from_the_weights():
+    content = "The market moved. " * 10 + _SECTIONS
+    result = Evaluator().evaluate_brief(_brief(content), "?!")
+
+    assert "coverage" not in _breakdown(result)
+    assert result.score == pytest.approx(1.0)
+    assert not result.is_complete  # coverage still counts as missing for completeness
+
+
+def test_content_without_sentences_drops_readability_from_the_weights():
+    result = Evaluator({"min_length": 1, "required_sections": []}).evaluate_brief(_brief("... !!! ???"), "")
+
+    breakdown = _breakdown(result)
+    assert set(breakdown) == {"length", "sections", "references"}
+    present = sum(_WEIGHTS[metric] for metric in breakdown)
+    expected = sum(score * _WEIGHTS[metric] for metric, score in breakdown.items()) / present
+    assert result.score == pytest.approx(expected)
+
+
+def test_missing_query_terms_are_suggested_in_sorted_order():
+    evaluator = Evaluator()
+    brief = _brief("Short brief about nothing much.")
+    result = evaluator.evaluate_brief(brief, "zebra trends apple market")
+
+    suggestions = evaluator.generate_improvement_suggestions(result, brief, "zebra trends apple market")
+
+    assert "key terms from the query: apple, market, trends, zebra." in " ".join(suggestions)
+
+
+def test_suggestions_from_a_bare_result_match_an_evaluated_one():
+    evaluator = Evaluator()
+    query = "Summarize apple market trends"
+    brief = _brief(" ".join(["This sentence has far too many words to read easily"] * 6) + ". Apple.", references=[])
+    evaluated = evaluator.evaluate_brief(brief, query)
+    bare = EvaluationResult(is_complete=False, feedback="", score=0.0)
+
+    assert bare._text_stats is None and bare._content_terms is None
+    suggestions = evaluator.generate_improvement_suggestions(bare, brief, query)
+    assert suggestions == evaluator.generate_improvement_suggestions(evaluated, brief, query)
+    assert any("Break down long sentences" in suggestion for suggestion in suggestions)
+    assert any("market, summarize, trends" in suggestion for suggestion in suggestions)
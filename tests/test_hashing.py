@@ -0,0 +1,37 @@
+"""Tests for the process-stable hashing helpers."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import core.hashing as hashing
+from core.hashing import stable_hash
+
+
+def _hash_in_subprocess(text: str, hash_seed: str) -> int:
+    env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+    output = subprocess.check_output(
+        [sys.executable, "-c", f"from core.hashing import stable_hash; print(stable_hash({text!r}))"],
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return int(output)
+
+
+def test_stable_hash_is_identical_across_processes():
+    assert _hash_in_subprocess("ai trends", "1") == _hash_in_subprocess("ai trends", "2") == stable_hash("ai trends")
+
+
+@pytest.mark.parametrize("use_xxhash", [True, False])
+def test_stable_hash_is_a_64_bit_value(monkeypatch, use_xxhash):
+    if use_xxhash:
+        pytest.importorskip("xxhash")
+    else:
+        monkeypatch.setattr(hashing, "xxhash", None)
+
+    value = stable_hash("ai trends \udc80")
+
+    assert 0 <= value < 2 ** 64
+    assert value == stable_hash("ai trends \udc80")
+    assert value != stable_hash("ai trend")
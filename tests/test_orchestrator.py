@@ -0,0 +1,120 @@
+"""Tests for the orchestrator and the streaming API endpoint."""
+import asyncio
+import json
+import threading
+import time
+import warnings
+
+import pytest
+from fastapi.testclient import TestClient
+
+import agents.orchestrator as orchestrator_module
+from agents.orchestrator import Orchestrator
+import app.main as app_main
+from app.main import app
+from core.types import APIRequest, WorkerType
+import tools.web_search_tool as web_search_tool
+
+_QUERY = "Summarize the latest trends in AI"
+
+
+@pytest.fixture(autouse=True)
+def _no_jit_warm_up(monkeypatch):
+    """Skip the startup warm-up, which may try to download NLTK data."""
+    monkeypatch.setattr(app_main, "_warm_jit", lambda orchestrator: None)
+
+
+async def _collect_events(orchestrator: Orchestrator, query: str = _QUERY):
+    return [event async for event in orchestrator.process_request_stream(APIRequest(query=query))]
+
+
+async def test_stream_emits_plan_then_workers_then_result():
+    orchestrator = Orchestrator()
+    try:
+        events = await _collect_events(orchestrator)
+    finally:
+        await orchestrator.close()
+
+    assert [event.event for event in events] == ["plan", "worker", "result"]
+    assert events[0].data["required_workers"] == ["web_search"]
+    assert events[0].data["context"]["intents"] == ["research"]
+    assert events[1].data == {"worker": "web_search", "success": True, "error": None}
+    assert events[2].data["success"] is True
+    assert "## Web Search" in events[2].data["brief"]["content"]
+
+
+async def test_stream_result_matches_process_request():
+    orchestrator = Orchestrator()
+    try:
+        events = await _collect_events(orchestrator)
+        response = await orchestrator.process_request(APIRequest(query=_QUERY))
+    finally:
+        await orchestrator.close()
+
+    assert events[-1].data["brief"]["content"] == response.brief.content
+
+
+async def test_stream_reports_cancelled_worker_and_still_finishes():
+    orchestrator = Orchestrator()
+
+    async def cancelled_process(query, context=None):
+        raise asyncio.CancelledError()
+
+    orchestrator.worker_registry[WorkerType.WEB_SEARCH].process = cancelled_process
+    try:
+        events = await _collect_events(orchestrator)
+    finally:
+        await orchestrator.close()
+
+    assert [event.event for event in events] == ["plan", "worker", "result"]
+    assert events[1].data["success"] is False
+    assert "cancelled" in events[1].data["error"]
+
+
+def test_concurrent_first_use_creates_one_summarizer(monkeypatch):
+    created = []
+
+    class SlowSummarizer:
+        def __init__(self):
+            time.sleep(0.05)  # Widen the race window, like an NLTK download would
+            created.append(self)
+
+    monkeypatch.setattr(orchestrator_module, "Summarizer", SlowSummarizer)
+    orchestrator = Orchestrator()
+    threads = [threading.Thread(target=lambda: orchestrator.summarizer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert orchestrator.summarizer is created[0]
+
+
+def test_run_stream_endpoint_sends_server_sent_events():
+    with TestClient(app) as client:
+        response = client.post("/run/stream", json={"query": _QUERY})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    frames = [frame for frame in response.text.split("\n\n") if frame]
+    assert all(frame.startswith("data: ") for frame in frames)
+    events = [json.loads(frame[len("data: "):]) for frame in frames]
+    assert [event["event"] for event in events] == ["plan", "worker", "result"]
+    assert events[-1]["data"]["success"] is True
+
+
+def test_startup_does_not_create_the_http_client():
+    with TestClient(app):
+        assert web_search_tool._SHARED_CLIENT is None
+
+
+def test_run_endpoint_uses_no_deprecated_response_class():
+    with TestClient(app) as client, warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        response = client.post("/run", json={"query": _QUERY})
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert not [w for w in caught if "Response is deprecated" in str(w.message)]
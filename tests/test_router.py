@@ -0,0 +1,81 @@
+"""Tests for intent detection and worker selection."""
+import random
+
+import pytest
+
+import agents.router as router_module
+from agents.router import INTENT_PATTERNS, Router
+from core.types import IntentType, WorkerType
+
+_QUERIES = [
+    "Summarize the latest trends in AI",
+    "Explain this function's implementation",
+    "Query the metrics and report the numbers",
+    "Analyze the market report and review the code",
+    "hello there",
+    "",
+    "RESEARCH THE SOURCE DATA",
+    "please look\nup the statistics",
+]
+
+
+def test_patterns_is_a_read_only_table_of_compiled_regexes():
+    patterns = Router().patterns
+
+    assert set(patterns) == set(IntentType)
+    assert all(hasattr(regex, "search") for regexes in patterns.values() for regex in regexes)
+    with pytest.raises(TypeError):
+        patterns[IntentType.RESEARCH] = ()
+
+
+@pytest.mark.parametrize("query", _QUERIES)
+def test_detect_intent_matches_searching_each_pattern(query):
+    router = Router()
+    expected = {
+        intent
+        for intent, regexes in router.patterns.items()
+        if any(regex.search(query) for regex in regexes)
+    } or {IntentType.RESEARCH}
+
+    assert set(router.detect_intent(query)) == expected
+
+
+def test_workers_are_listed_in_declaration_order():
+    workers = Router().select_workers("Research the code and query the data")
+
+    assert workers == [WorkerType.WEB_SEARCH, WorkerType.CODE_READ, WorkerType.DATA_QUERY]
+
+
+def _random_queries(count: int):
+    """Mix every intent keyword with filler words, in random case and order."""
+    keywords = [
+        word
+        for patterns in INTENT_PATTERNS.values()
+        for pattern in patterns
+        for word in pattern.strip("()").split("|")
+    ]
+    words = keywords + ["analyse", "statistic", "trend", "the", "latest", "about", "x", "look", "up"]
+    rng = random.Random(42)
+    for _ in range(count):
+        query = " ".join(rng.choices(words, k=rng.randint(0, 6)))
+        yield "".join(ch.upper() if rng.random() < 0.3 else ch for ch in query)
+
+
+def _detect_all(queries):
+    router_module._detect_intents.cache_clear()
+    try:
+        return [Router().detect_intent(query) for query in queries]
+    finally:
+        router_module._detect_intents.cache_clear()
+
+
+def test_re2_set_and_stdlib_matcher_detect_the_same_intents(monkeypatch):
+    pytest.importorskip("re2")
+    assert router_module._INTENT_SET is not None
+    queries = _QUERIES + list(_random_queries(2000))
+
+    with_re2 = _detect_all(queries)
+    monkeypatch.setattr(router_module, "_INTENT_SET", None)
+    with_stdlib = _detect_all(queries)
+
+    assert with_re2 == with_stdlib
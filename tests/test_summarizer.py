@@ -0,0 +1,173 @@
+"""Tests for the extractive summarizer."""
+import logging
+import random
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import tools.summarizer as summarizer_module
+from tools.summarizer import Summarizer
+
+_VOCAB = (
+    "ai data model neural network deep learning market trend research code "
+    "alpha beta gamma delta the a of and is"
+).split()
+_STOP_WORDS = frozenset({"the", "a", "of", "and", "is"})
+
+
+def _random_text(rng: random.Random, n_sentences: int) -> str:
+    """Build a text of capitalized sentences from a small, repetitive vocabulary."""
+    sentences = []
+    for _ in range(n_sentences):
+        words = rng.choices(_VOCAB, k=rng.randint(4, 25))
+        sentences.append(" ".join(words).capitalize() + rng.choice(".!?"))
+    return " ".join(sentences)
+
+
+def _make_summarizer(**config) -> Summarizer:
+    summarizer = Summarizer({"use_stopwords": False, **config})
+    summarizer.stop_words = _STOP_WORDS
+    return summarizer
+
+
+def test_numba_and_python_paths_agree(monkeypatch):
+    pytest.importorskip("numba")
+    texts = []
+    for seed in range(2000):
+        rng = random.Random(seed)
+        texts.append(_random_text(rng, rng.randint(6, 60)))
+
+    jit_summaries = [_make_summarizer()._extractive_summarize(text) for text in texts]
+    monkeypatch.setattr(summarizer_module, "njit", None)
+    python_summaries = [_make_summarizer()._extractive_summarize(text) for text in texts]
+
+    assert python_summaries == jit_summaries
+
+
+@pytest.mark.parametrize("use_jit", [True, False])
+def test_ties_keep_the_earliest_sentences(monkeypatch, use_jit):
+    if use_jit:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(summarizer_module, "njit", None)
+    # Sentences 0, 1 and 19 get the position boost; the rest tie, so the
+    # earliest of them fill the remaining slots
+    sentences = [f"Sentence {i} repeats alpha beta gamma delta words here." for i in range(20)]
+    summary = _make_summarizer(max_sentences=5, min_sentence_length=3)._extractive_summarize(" ".join(sentences))
+
+    assert summary == " ".join(sentences[i] for i in (0, 1, 2, 3, 19))
+
+
+@pytest.mark.parametrize("use_jit", [True, False])
+@pytest.mark.parametrize("max_sentences", [0, -1, -5])
+def test_non_positive_max_sentences_selects_nothing(monkeypatch, use_jit, max_sentences):
+    if use_jit:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(summarizer_module, "njit", None)
+    text = _random_text(random.Random(7), 8)
+
+    assert _make_summarizer(max_sentences=max_sentences, min_sentence_length=1).summarize(text) == ""
+
+
+def test_short_text_is_returned_unchanged():
+    text = "One sentence that is long enough to keep around. Another one also long enough to keep."
+
+    assert _make_summarizer(max_sentences=5, min_sentence_length=3).summarize(text) == text
+
+
+def test_word_tokens_keep_non_ascii_letters():
+    assert summarizer_module._WORD_RE.findall("café naïve für x_y 42") == ["café", "naïve", "für", "x", "y", "42"]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Das ist gut. Über alles geht es. Ärger kommt später.",
+     ["Das ist gut.", "Über alles geht es.", "Ärger kommt später."]),
+    ("C'est fini. État des lieux. Élan vital.",
+     ["C'est fini.", "État des lieux.", "Élan vital."]),
+    ("It rained. \u201cQuoted start\u201d here. \u00abOui\u00bb dit-il. Done.",
+     ["It rained.", "\u201cQuoted start\u201d here.", "\u00abOui\u00bb dit-il.", "Done."]),
+    ("Use e.g. this one. 42 is the answer.", ["Use e.g. this one.", "42 is the answer."]),
+])
+def test_sentences_split_before_any_uppercase_letter_or_digit(text, expected):
+    assert summarizer_module._split_sentences(text) == expected
+
+
+def test_summary_cache_is_keyed_on_the_exact_text(monkeypatch):
+    summarizer = _make_summarizer()
+    calls = []
+    monkeypatch.setattr(summarizer, "_extractive_summarize", lambda text: calls.append(text) or text.upper())
+
+    assert summarizer.summarize("first text") == "FIRST TEXT"
+    assert summarizer.summarize("second text") == "SECOND TEXT"
+    assert summarizer.summarize("first text") == "FIRST TEXT"
+    assert calls == ["first text", "second text"]
+
+
+def test_summary_cache_misses_after_config_or_stopwords_change(monkeypatch):
+    summarizer = _make_summarizer()
+    calls = []
+    monkeypatch.setattr(summarizer, "_extractive_summarize", lambda text: calls.append(text) or text)
+
+    summarizer.summarize("some text")
+    summarizer.config.max_sentences = 2
+    summarizer.summarize("some text")
+    summarizer.stop_words = frozenset({"some"})
+    summarizer.summarize("some text")
+    summarizer.summarize("some text")
+
+    assert calls == ["some text"] * 3
+
+
+async def test_summarize_async_matches_summarize_and_runs_off_the_loop(monkeypatch):
+    text = _random_text(random.Random(3), 20)
+    expected = _make_summarizer().summarize(text)
+    summarizer = _make_summarizer()
+    threads = []
+    extractive = summarizer._extractive_summarize
+
+    def recording_summarize(text):
+        threads.append(threading.get_ident())
+        return extractive(text)
+
+    monkeypatch.setattr(summarizer, "_extractive_summarize", recording_summarize)
+
+    assert await summarizer.summarize_async(text) == expected
+    assert threads and threads[0] != threading.get_ident()
+
+
+def _fake_nltk(monkeypatch, installed):
+    downloads = []
+
+    def find(resource):
+        if not installed:
+            raise LookupError(resource)
+        return resource
+
+    monkeypatch.setattr(summarizer_module, "_nltk_ready", False)
+    monkeypatch.setattr(summarizer_module.nltk.data, "find", find)
+    monkeypatch.setattr(summarizer_module.nltk, "download", lambda *args, **kwargs: downloads.append(args) or False)
+    monkeypatch.setattr(summarizer_module, "stopwords", SimpleNamespace(words=lambda language: ["the", "a"]))
+    return downloads
+
+
+def test_missing_stopwords_fall_back_to_an_empty_set(monkeypatch, caplog):
+    downloads = _fake_nltk(monkeypatch, installed=False)
+
+    with caplog.at_level(logging.WARNING, logger=summarizer_module.__name__):
+        first = Summarizer()
+        second = Summarizer()
+
+    assert first.stop_words == second.stop_words == frozenset()
+    assert summarizer_module._nltk_ready is False
+    assert len(downloads) == 2  # retried, since the first download failed
+    assert "stopwords corpus unavailable" in caplog.text
+
+
+def test_installed_stopwords_are_loaded_without_downloading(monkeypatch):
+    downloads = _fake_nltk(monkeypatch, installed=True)
+
+    assert Summarizer().stop_words == frozenset({"the", "a"})
+    assert summarizer_module._nltk_ready is True
+    assert downloads == []
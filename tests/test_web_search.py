@@ -0,0 +1,260 @@
+"""Tests for web search batching and caching."""
+import asyncio
+
+import pytest
+
+from core.types import WorkerResponse, WorkerResult
+from tools.web_search_tool import WebSearchTool, _BatchScheduler
+from workers.web_search import RESPONSE_CACHE_SIZE, WebSearchWorker
+
+
+def _recording_fetch(calls, delay=0.0):
+    async def fetch(query, num_results):
+        calls.append(query)
+        await asyncio.sleep(delay)
+        if query == "bad":
+            raise RuntimeError("backend failed")
+        return [{"title": query, "url": "", "snippet": "", "source": "test"}]
+    return fetch
+
+
+async def test_batch_dedupes_identical_searches():
+    calls = []
+    fetch = _recording_fetch(calls)
+    scheduler = _BatchScheduler()
+
+    results = await asyncio.gather(*(scheduler.submit(fetch, q, 3) for q in ["a", "b", "a", "a"]))
+
+    assert sorted(calls) == ["a", "b"]
+    assert [r[0]["title"] for r in results] == ["a", "b", "a", "a"]
+
+
+async def test_batch_waiters_get_independent_lists():
+    fetch = _recording_fetch([])
+    scheduler = _BatchScheduler()
+
+    first, second = await asyncio.gather(scheduler.submit(fetch, "a", 3), scheduler.submit(fetch, "a", 3))
+
+    assert first == second
+    assert first is not second
+
+
+async def test_batch_failure_only_reaches_its_own_waiters():
+    fetch = _recording_fetch([])
+    scheduler = _BatchScheduler()
+
+    results = await asyncio.gather(
+        scheduler.submit(fetch, "ok", 3),
+        scheduler.submit(fetch, "bad", 3),
+        return_exceptions=True
+    )
+
+    assert results[0][0]["title"] == "ok"
+    assert isinstance(results[1], RuntimeError)
+
+
+async def test_scopes_do_not_share_results():
+    calls = []
+    fetch = _recording_fetch(calls)
+    scheduler = _BatchScheduler()
+
+    await asyncio.gather(scheduler.submit(fetch, "a", 3, "key1"), scheduler.submit(fetch, "a", 3, "key2"))
+
+    assert calls == ["a", "a"]
+
+
+@pytest.mark.parametrize("limits", [{"max_batch": 4}, {"max_bytes": 8}])
+async def test_batch_flushes_before_the_delay_when_full(limits):
+    calls = []
+    fetch = _recording_fetch(calls)
+    scheduler = _BatchScheduler(max_delay=60.0, **limits)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(scheduler.submit(fetch, f"q{i}", 3) for i in range(4))),
+        timeout=1.0
+    )
+
+    assert len(results) == 4
+    assert sorted(calls) == ["q0", "q1", "q2", "q3"]
+
+
+async def test_batch_tasks_are_held_until_done():
+    fetch = _recording_fetch([], delay=0.01)
+    scheduler = _BatchScheduler()
+
+    waiter = asyncio.ensure_future(scheduler.submit(fetch, "a", 3))
+    await asyncio.sleep(scheduler.max_delay * 2)
+    assert len(scheduler._tasks) == 1
+
+    await waiter
+    await asyncio.sleep(0)
+    assert not scheduler._tasks
+
+
+async def test_cancelled_waiter_does_not_break_the_batch():
+    fetch = _recording_fetch([], delay=0.01)
+    scheduler = _BatchScheduler()
+
+    cancelled = asyncio.ensure_future(scheduler.submit(fetch, "a", 3))
+    kept = asyncio.ensure_future(scheduler.submit(fetch, "a", 3))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert (await kept)[0]["title"] == "a"
+
+
+async def test_searches_from_different_tools_share_a_batch(monkeypatch):
+    calls = []
+    fetch = _recording_fetch(calls)
+
+    async def real_search(self, query, num_results):
+        return await fetch(query, num_results)
+
+    monkeypatch.setattr(WebSearchTool, "_real_search", real_search)
+    tools = [WebSearchTool(offline=False), WebSearchTool(offline=False)]
+
+    results = await asyncio.gather(*(tool.search("shared") for tool in tools))
+
+    assert calls == ["shared"]
+    assert [r[0]["title"] for r in results] == ["shared", "shared"]
+
+
+def _counting_worker(monkeypatch, delay=0.0, fail=False):
+    worker = WebSearchWorker()
+    calls = []
+
+    async def process_uncached(query, context=None):
+        calls.append(query)
+        await asyncio.sleep(delay)
+        if fail:
+            return WorkerResponse(success=False, error="failed")
+        return WorkerResponse(
+            success=True,
+            result=WorkerResult(content=query, metadata={"config": {"n": 1}}, source="test")
+        )
+
+    monkeypatch.setattr(worker, "_process_uncached", process_uncached)
+    return worker, calls
+
+
+async def test_worker_caches_successful_responses(monkeypatch):
+    worker, calls = _counting_worker(monkeypatch)
+
+    first = await worker.process("query")
+    second = await worker.process("query")
+
+    assert calls == ["query"]
+    assert second.result.content == first.result.content
+
+
+async def test_worker_does_not_cache_failures(monkeypatch):
+    worker, calls = _counting_worker(monkeypatch, fail=True)
+
+    await worker.process("query")
+    await worker.process("query")
+
+    assert calls == ["query", "query"]
+
+
+async def test_worker_cache_evicts_least_recently_used(monkeypatch):
+    worker, calls = _counting_worker(monkeypatch)
+
+    for i in range(RESPONSE_CACHE_SIZE + 1):
+        await worker.process(f"q{i}")
+    await worker.process("q0")
+
+    assert calls.count("q0") == 2
+    assert len(worker._cache) == RESPONSE_CACHE_SIZE
+
+
+async def test_worker_coalesces_concurrent_identical_queries(monkeypatch):
+    worker, calls = _counting_worker(monkeypatch, delay=0.01)
+
+    responses = await asyncio.gather(*(worker.process("query") for _ in range(5)))
+
+    assert calls == ["query"]
+    assert all(response.success for response in responses)
+    assert not worker._inflight
+
+
+async def test_cancelled_caller_does_not_cancel_coalesced_search(monkeypatch):
+    worker, calls = _counting_worker(monkeypatch, delay=0.01)
+
+    cancelled = asyncio.ensure_future(worker.process("query"))
+    kept = asyncio.ensure_future(worker.process("query"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert (await kept).success
+    assert calls == ["query"]
+
+
+async def test_worker_responses_are_independent_copies(monkeypatch):
+    worker, _ = _counting_worker(monkeypatch, delay=0.01)
+
+    first, second = await asyncio.gather(worker.process("query"), worker.process("query"))
+    first.result.metadata["config"]["n"] = 99
+    third = await worker.process("query")
+
+    assert second.result.metadata["config"]["n"] == 1
+    assert third.result.metadata["config"]["n"] == 1
+
+
+async def test_worker_close_cancels_inflight_searches_and_clears_cache(monkeypatch):
+    worker, _ = _counting_worker(monkeypatch, delay=0.01)
+    await worker.process("cached")
+
+    pending = asyncio.ensure_future(worker.process("query"))
+    await asyncio.sleep(0)
+    await worker.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    assert not worker._cache
+    assert not worker._inflight
+
+
+def test_searches_work_again_on_a_new_event_loop(monkeypatch):
+    calls = []
+    fetch = _recording_fetch(calls)
+
+    async def real_search(self, query, num_results):
+        return await fetch(query, num_results)
+
+    monkeypatch.setattr(WebSearchTool, "_real_search", real_search)
+    tool = WebSearchTool(offline=False)
+
+    async def end_loop_with_a_queued_search():
+        pending = asyncio.ensure_future(tool.search("a"))
+        await asyncio.sleep(0)
+        pending.cancel()
+
+    asyncio.run(end_loop_with_a_queued_search())
+    results = asyncio.run(asyncio.wait_for(tool.search("b"), timeout=1.0))
+
+    assert results[0]["title"] == "b"
+
+
+async def test_cache_hit_skips_the_search_and_formatting(monkeypatch):
+    worker = WebSearchWorker()
+    first = await worker.process("query")
+
+    async def fail_search(query, context=None):
+        raise AssertionError("cache hit ran the search")
+
+    def fail_format(results):
+        raise AssertionError("cache hit formatted results")
+
+    monkeypatch.setattr(worker, "_process_uncached", fail_search)
+    monkeypatch.setattr(worker, "_format_results", fail_format)
+    hit = await worker.process("query")
+
+    assert hit.result.content == first.result.content
+
+
+async def test_tool_close_is_a_safe_no_op():
+    tool = WebSearchTool(offline=True)
+
+    await tool.close()
+
+    assert (await tool.search("still works"))[0]["title"].startswith("Still Works")
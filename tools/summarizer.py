@@ -5,17 +5,135 @@ This module provides functionality for generating concise summaries from text co
 It includes both a simple extractive summarizer and a placeholder for more advanced
 abstractive summarization.
 """
+import asyncio
+import heapq
+import logging
 import re
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
-from collections import defaultdict
+import threading
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from dataclasses import astuple, dataclass
+from collections import Counter, OrderedDict
+from itertools import chain, compress
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
+import numpy as np
 from nltk.corpus import stopwords
 
-# Download required NLTK data
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
+try:
+    from numba import njit
+except ImportError:  # Optional dependency, fall back to the pure Python scorer
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Set once the NLTK data the summarizer needs is known to be installed
+_nltk_ready = False
+
+def _ensure_nltk() -> bool:
+    """
+    Download the NLTK stopwords corpus on first use, only if it is missing.
+    
+    Returns:
+        True if the corpus is installed, False if it could not be downloaded
+    """
+    global _nltk_ready
+    if _nltk_ready:
+        return True
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        # nltk.download reports failures (e.g. offline) by returning, not raising
+        nltk.download('stopwords', quiet=True)
+        try:
+            nltk.data.find('corpora/stopwords')
+        except LookupError:
+            return False
+    _nltk_ready = True
+    return True
+
+# Maximum number of summaries kept in each Summarizer's LRU cache
+SUMMARY_CACHE_SIZE = 512
+
+# Precompiled tokenizers used instead of NLTK's Punkt/Treebank tokenizers.
+# Words are runs of Unicode letters and digits, like word_tokenize + isalnum()
+_WORD_RE = re.compile(r"[^\W_]+")
+# Candidate sentence breaks: whitespace after .!?
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+# Opening punctuation skipped when checking how a sentence starts
+_SENT_OPENERS = '"\'([\u201c\u2018\u00ab\u201e'
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences at .!? followed by whitespace.
+    
+    A break only counts when the next fragment starts (after optional opening
+    quotes or brackets) with an uppercase letter or a digit in any script, like
+    Punkt's isupper() check, so "e.g. this" stays one sentence.
+    
+    Args:
+        text: The text to split
+        
+    Returns:
+        List of sentences
+    """
+    sentences: List[str] = []
+    start = 0
+    n = len(text)
+    for match in _SENT_RE.finditer(text):
+        i = match.end()
+        while i < n and text[i] in _SENT_OPENERS:
+            i += 1
+        if i < n and (text[i].isupper() or text[i].isdigit()):
+            sentences.append(text[start:match.start()])
+            start = match.end()
+    sentences.append(text[start:])
+    return sentences
+
+def _score_all(tokens, starts, ends, vocab_size):
+    """
+    Score sentences from a flat array of token ids.
+    
+    Word frequencies are counted over all tokens (ids < 0 are stopwords and
+    are skipped), normalized by the maximum, then each sentence
+    ``tokens[starts[i]:ends[i]]`` gets its mean frequency with a 1.5x boost
+    for the first and last 10% of sentences.
+    
+    The arithmetic mirrors the pure Python scorer step for step (float64
+    throughout, rounded to float32 once per sentence) so both paths rank
+    sentences identically.
+    """
+    freqs = np.zeros(vocab_size, np.float64)
+    for j in range(tokens.shape[0]):
+        if tokens[j] >= 0:
+            freqs[tokens[j]] += 1.0
+    
+    max_freq = 0.0
+    for k in range(vocab_size):
+        if freqs[k] > max_freq:
+            max_freq = freqs[k]
+    if max_freq > 0.0:
+        inv_max_freq = 1.0 / max_freq
+        for k in range(vocab_size):
+            freqs[k] *= inv_max_freq
+    
+    n_sent = starts.shape[0]
+    scores = np.zeros(n_sent, np.float32)
+    for i in range(n_sent):
+        score = 0.0
+        for j in range(starts[i], ends[i]):
+            if tokens[j] >= 0:
+                score += freqs[tokens[j]]
+        length = ends[i] - starts[i]
+        if length > 0:
+            score /= length
+        position = i / n_sent
+        if position < 0.1 or position > 0.9:  # First or last 10%
+            score *= 1.5
+        scores[i] = score
+    return scores
+
+if njit is not None:
+    # nogil lets summarizations running in worker threads score in parallel
+    _score_all = njit(cache=True, nogil=True)(_score_all)
 
 @dataclass
 class SummaryConfig:
@@ -43,7 +161,14 @@ class Summarizer:
             config: Optional configuration dictionary
         """
         self.config = self._parse_config(config or {})
-        self.stop_words = set(stopwords.words(self.config.language)) if self.config.use_stopwords else set()
+        if self.config.use_stopwords and _ensure_nltk():
+            self.stop_words = frozenset(stopwords.words(self.config.language))
+        else:
+            if self.config.use_stopwords:
+                logger.warning("NLTK stopwords corpus unavailable, summarizing without stopwords")
+            self.stop_words = frozenset()
+        self._cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def _parse_config(self, config: Dict[str, Any]) -> SummaryConfig:
         """
@@ -76,13 +201,59 @@ class Summarizer:
         """
         if not text.strip():
             return ""
+        
+        method_name = method.lower()
+        if method_name not in ("extractive", "abstractive"):
+            raise ValueError(f"Unsupported summarization method: {method}")
+        
+        # Config and stopwords can be changed after construction, so they are
+        # part of the key; str and frozenset cache their own hashes
+        key = (text, method_name, astuple(self.config), self.stop_words)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
             
-        if method.lower() == "extractive":
-            return self._extractive_summarize(text)
-        elif method.lower() == "abstractive":
-            return self._abstractive_summarize(text)
+        if method_name == "extractive":
+            summary = self._extractive_summarize(text)
         else:
-            raise ValueError(f"Unsupported summarization method: {method}")
+            summary = self._abstractive_summarize(text)
+        
+        with self._cache_lock:
+            self._cache[key] = summary
+            if len(self._cache) > SUMMARY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return summary
+    
+    def summarize_iter(self, chunks: Iterable[str], method: str = "extractive") -> str:
+        """
+        Generate a summary of text supplied as a sequence of chunks.
+        
+        Lets callers hand over a buffer of pieces without concatenating it
+        first; the chunks are joined exactly once here.
+        
+        Args:
+            chunks: Pieces of the text to summarize, in order
+            method: The summarization method to use ('extractive' or 'abstractive')
+            
+        Returns:
+            The generated summary
+        """
+        return self.summarize("".join(chunks), method)
+    
+    async def summarize_async(self, text: str, method: str = "extractive") -> str:
+        """
+        Generate a summary in a worker thread, keeping the event loop free.
+        
+        Args:
+            text: The text to summarize
+            method: The summarization method to use ('extractive' or 'abstractive')
+            
+        Returns:
+            The generated summary
+        """
+        return await asyncio.to_thread(self.summarize, text, method)
     
     def _extractive_summarize(self, text: str) -> str:
         """
@@ -98,10 +269,12 @@ class Summarizer:
             The generated summary
         """
         # Tokenize the text into sentences
-        sentences = sent_tokenize(text, language=self.config.language)
+        all_sentences = _split_sentences(text.strip())
         
         # Filter out very short sentences
-        sentences = [s for s in sentences if len(s.split()) >= self.config.min_sentence_length]
+        min_length = self.config.min_sentence_length
+        is_candidate = [len(s.split()) >= min_length for s in all_sentences]
+        sentences = list(compress(all_sentences, is_candidate))
         
         if not sentences:
             return ""
@@ -110,97 +283,155 @@ class Summarizer:
         if len(sentences) <= self.config.max_sentences:
             return " ".join(sentences)
         
-        # Calculate word frequencies
-        word_frequencies = self._calculate_word_frequencies(text)
+        # Tokenize every sentence once; frequency counting and sentence
+        # scoring both consume this single token stream
+        sent_token_lists = [_WORD_RE.findall(s.lower()) for s in all_sentences]
+        
+        if njit is not None:
+            return self._extractive_summarize_jit(sentences, sent_token_lists, is_candidate)
+        
+        # Calculate word frequencies over the whole text
+        word_frequencies = self._calculate_word_frequencies(
+            chain.from_iterable(sent_token_lists)
+        )
         
         # Score sentences based on word frequencies and position
-        sentence_scores = self._score_sentences(sentences, word_frequencies)
+        sentence_scores = self._score_sentences(
+            list(compress(sent_token_lists, is_candidate)),
+            word_frequencies
+        )
         
-        # Get top N sentences
-        top_sentences = sorted(
-            sentence_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:self.config.max_sentences]
+        return self._join_top_sentences(sentences, sentence_scores)
+    
+    def _extractive_summarize_jit(
+        self,
+        sentences: List[str],
+        sent_token_lists: List[List[str]],
+        is_candidate: List[bool]
+    ) -> str:
+        """
+        Select the top sentences using the Numba-compiled scoring kernel.
         
-        # Sort the selected sentences by their original position
-        top_sentences_sorted = sorted(top_sentences, key=lambda x: x[0])
+        Tokens are interned to int ids in one pass over the sentences, then
+        frequency counting and sentence scoring run in native code.
         
-        # Join the selected sentences to form the summary
-        summary = " ".join([sentences[idx] for idx, _ in top_sentences_sorted])
+        Args:
+            sentences: The sentences long enough to be candidates
+            sent_token_lists: Word tokens of every sentence in the text
+            is_candidate: Whether each sentence in the text is a candidate
+            
+        Returns:
+            The generated summary
+        """
+        stop_words = self.stop_words
+        vocab: Dict[str, int] = {}
+        token_ids: List[int] = []
+        starts: List[int] = []
+        ends: List[int] = []
         
-        return summary
+        for tokens, candidate in zip(sent_token_lists, is_candidate):
+            start = len(token_ids)
+            for word in tokens:
+                if word in stop_words:
+                    token_ids.append(-1)
+                else:
+                    token_ids.append(vocab.setdefault(word, len(vocab)))
+            if candidate:
+                starts.append(start)
+                ends.append(len(token_ids))
+        
+        scores = _score_all(
+            np.asarray(token_ids, dtype=np.int32),
+            np.asarray(starts, dtype=np.int64),
+            np.asarray(ends, dtype=np.int64),
+            len(vocab)
+        )
+        
+        return self._join_top_sentences(sentences, scores)
     
-    def _calculate_word_frequencies(self, text: str) -> Dict[str, int]:
+    def _join_top_sentences(self, sentences: List[str], scores: np.ndarray) -> str:
         """
-        Calculate word frequencies in the given text.
+        Join the highest scoring sentences in their original order.
         
         Args:
-            text: The input text
+            sentences: The candidate sentences
+            scores: Score of each candidate sentence
+            
+        Returns:
+            The generated summary
+        """
+        max_sentences = self.config.max_sentences
+        if max_sentences <= 0:
+            return ""
+        
+        # Get top N sentences (O(N log K) rather than a full sort); nlargest
+        # is stable, so the earliest of tied sentences wins
+        score_list = scores.tolist()
+        top_idx = heapq.nlargest(max_sentences, range(len(score_list)), key=score_list.__getitem__)
+        
+        # Sort the selected sentences by their original position
+        top_idx.sort()
+        
+        return " ".join(sentences[idx] for idx in top_idx)
+    
+    def _calculate_word_frequencies(self, words: Iterable[str]) -> Dict[str, float]:
+        """
+        Calculate normalized word frequencies from a token stream.
+        
+        Args:
+            words: Lowercased word tokens of the text
             
         Returns:
             Dictionary mapping words to their frequencies
         """
-        # Tokenize into words and remove punctuation
-        words = word_tokenize(text.lower(), language=self.config.language)
-        words = [word for word in words if word.isalnum()]
-        
-        # Remove stopwords
-        if self.config.use_stopwords:
-            words = [word for word in words if word not in self.stop_words]
-        
-        # Calculate frequencies
-        word_frequencies = defaultdict(int)
-        for word in words:
-            word_frequencies[word] += 1
+        # Calculate frequencies, skipping stopwords (tokens are already alphanumeric)
+        stop_words = self.stop_words
+        word_frequencies = Counter(word for word in words if word not in stop_words)
             
-        # Normalize frequencies
-        if word_frequencies:
-            max_freq = max(word_frequencies.values())
-            for word in word_frequencies:
-                word_frequencies[word] = word_frequencies[word] / max_freq
-                
-        return dict(word_frequencies)
+        # Normalize frequencies with one division and a multiply per word
+        if not word_frequencies:
+            return {}
+        inv_max_freq = 1.0 / max(word_frequencies.values())
+        return {word: count * inv_max_freq for word, count in word_frequencies.items()}
     
     def _score_sentences(
         self,
-        sentences: List[str],
+        sent_token_lists: List[List[str]],
         word_frequencies: Dict[str, float]
-    ) -> Dict[int, float]:
+    ) -> np.ndarray:
         """
         Score sentences based on word frequencies and position.
         
         Args:
-            sentences: List of sentences
+            sent_token_lists: Word tokens of each candidate sentence
             word_frequencies: Dictionary of word frequencies
             
         Returns:
-            Dictionary mapping sentence indices to their scores
+            Array of sentence scores, indexed like sent_token_lists
         """
-        sentence_scores = {}
+        # Accumulate in float64 and round to float32 once at the end, exactly
+        # like the Numba kernel, so both paths produce the same scores
+        n_sent = len(sent_token_lists)
+        sentence_scores = np.zeros(n_sent, dtype=np.float64)
+        get_freq = word_frequencies.get
         
-        for idx, sentence in enumerate(sentences):
-            words = word_tokenize(sentence.lower())
-            words = [word for word in words if word.isalnum()]
-            
-            # Calculate sentence score based on word frequencies
+        for idx, words in enumerate(sent_token_lists):
+            # Calculate sentence score based on word frequencies (summed left
+            # to right; builtin sum() is compensated on newer Pythons)
             score = 0.0
             for word in words:
-                if word in word_frequencies:
-                    score += word_frequencies[word]
+                score += get_freq(word, 0.0)
             
             # Normalize by sentence length
-            if len(words) > 0:
+            if words:
                 score /= len(words)
-            
-            # Boost score for sentences at the beginning or end of the text
-            position = idx / len(sentences)
-            if position < 0.1 or position > 0.9:  # First or last 10%
-                score *= 1.5
-            
             sentence_scores[idx] = score
+        
+        # Boost score for sentences at the beginning or end of the text
+        position = np.arange(n_sent) / n_sent
+        sentence_scores[(position < 0.1) | (position > 0.9)] *= 1.5  # First or last 10%
             
-        return sentence_scores
+        return sentence_scores.astype(np.float32)
     
     def _abstractive_summarize(self, text: str) -> str:
         """
@@ -7,12 +7,156 @@ to perform web searches. It includes a stub implementation for offline use.
 import os
 import json
 import random
-from typing import List, Dict, Optional, Any
+import asyncio
+import weakref
+from typing import Awaitable, Callable, List, Dict, Optional, Any, Set, Tuple
 import httpx
 from datetime import datetime
+from types import MappingProxyType
 
+from core.hashing import stable_hash
 from core.types import WebSearchResult
 
+# HTTP client shared by all WebSearchTool instances, so every search reuses
+# one keep-alive/HTTP2 connection pool. Created lazily by the first real
+# (online) search, closed at app shutdown.
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client, creating it on first use.
+    
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100)
+        )
+    return _SHARED_CLIENT
+
+async def close_shared_client():
+    """Close the process-wide HTTP client, if it was created."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
+# Backend search coroutine function: (query, num_results) -> results
+_SearchFetch = Callable[[str, int], Awaitable[List[WebSearchResult]]]
+
+class _BatchScheduler:
+    """
+    Pipelines searches issued close together into one batch.
+    
+    Searches submitted within ``max_delay`` seconds of each other are flushed
+    together, or sooner once ``max_batch`` searches or ``max_bytes`` of query
+    text are pending. Identical searches in the same scope (e.g. API key) are
+    deduplicated and the unique ones run concurrently over the shared client.
+    """
+    
+    def __init__(
+        self,
+        max_batch: int = 16,
+        max_bytes: int = 8192,
+        max_delay: float = 0.005
+    ):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            max_batch: Number of pending searches that triggers an immediate flush
+            max_bytes: Size of pending query text that triggers an immediate flush
+            max_delay: Maximum time in seconds a search waits for its batch
+        """
+        self.max_batch = max_batch
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self._pending: List[Tuple[Tuple, _SearchFetch, asyncio.Future]] = []
+        self._pending_bytes = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Running batch tasks; the event loop only keeps weak references
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(
+        self,
+        fetch: _SearchFetch,
+        query: str,
+        num_results: int,
+        scope: Optional[str] = None
+    ) -> List[WebSearchResult]:
+        """
+        Queue a search and wait for its batch to complete.
+        
+        Args:
+            fetch: Coroutine function performing the backend search
+            query: The search query string
+            num_results: Maximum number of results to return
+            scope: Searches only share results with others in the same scope
+            
+        Returns:
+            List of search results
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((scope, query, num_results), fetch, future))
+        self._pending_bytes += len(query.encode("utf-8", "surrogatepass"))
+        
+        if len(self._pending) >= self.max_batch or self._pending_bytes >= self.max_bytes:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay, self._flush)
+        
+        return list(await future)
+    
+    def _flush(self):
+        """Hand all pending searches to a batch task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        self._pending_bytes = 0
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[Tuple, _SearchFetch, asyncio.Future]]):
+        """Run each unique search in the batch once and resolve every waiter."""
+        fetch_by_key: Dict[Tuple, _SearchFetch] = {}
+        for key, fetch, _ in batch:
+            fetch_by_key.setdefault(key, fetch)
+        results = await asyncio.gather(
+            *(fetch(query, num_results) for (_, query, num_results), fetch in fetch_by_key.items()),
+            return_exceptions=True
+        )
+        results_by_key = dict(zip(fetch_by_key, results))
+        
+        for key, _, future in batch:
+            if future.done():  # Waiter was cancelled
+                continue
+            result = results_by_key[key]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+# Schedulers shared by all WebSearchTool instances, so searches from different
+# workers and tools are batched together. A scheduler's timer and pending
+# futures belong to one event loop, so there is one per running loop.
+_BATCHERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _BatchScheduler]" = weakref.WeakKeyDictionary()
+
+def _get_batcher() -> _BatchScheduler:
+    """Return the batch scheduler for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    batcher = _BATCHERS.get(loop)
+    if batcher is None:
+        batcher = _BATCHERS[loop] = _BatchScheduler()
+    return batcher
+
 class WebSearchTool:
     """
     A tool for performing web searches with both online and offline capabilities.
@@ -31,10 +175,9 @@ class WebSearchTool:
         """
         self.offline = offline
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
         
-        # Mock data for offline mode
-        self.mock_data = [
+        # Mock data for offline mode; read-only templates for _mock_search
+        self.mock_data = [MappingProxyType(tpl) for tpl in (
             {
                 "title": "Example Search Result 1",
                 "url": "https://example.com/1",
@@ -53,7 +196,12 @@ class WebSearchTool:
                 "snippet": "Yet another example result with unique information.",
                 "source": "mock"
             }
-        ]
+        )]
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client used for real searches."""
+        return get_shared_client()
     
     async def search(self, query: str, num_results: int = 3) -> List[WebSearchResult]:
         """
@@ -70,7 +218,7 @@ class WebSearchTool:
             return self._mock_search(query, num_results)
         
         try:
-            return await self._real_search(query, num_results)
+            return await _get_batcher().submit(self._real_search, query, num_results, self.api_key)
         except Exception as e:
             print(f"Error performing web search: {e}")
             print("Falling back to mock search")
@@ -153,21 +301,31 @@ class WebSearchTool:
             List of mock search results
         """
         # Create a deterministic but varied result based on the query
-        query_hash = hash(query) % 1000
+        query_hash = stable_hash(query) % 1000
+        query_title = query.title()
         results = []
         
         for i in range(min(num_results, len(self.mock_data))):
-            # Modify the mock data based on query to make it look more realistic
-            result = self.mock_data[i].copy()
-            result["title"] = f"{query.title()}: {result['title']}"
-            result["snippet"] = f"Result for '{query}'. {result['snippet']} Query hash: {query_hash}."
-            results.append(WebSearchResult(**result))
+            # Build the result straight from its template, customized by the
+            # query to look more realistic
+            tpl = self.mock_data[i]
+            results.append({
+                "title": f"{query_title}: {tpl['title']}",
+                "url": tpl["url"],
+                "snippet": f"Result for '{query}'. {tpl['snippet']} Query hash: {query_hash}.",
+                "source": tpl["source"]
+            })  # Already shaped like WebSearchResult
             
         return results
     
     async def close(self):
-        """Clean up resources."""
-        await self.client.aclose()
+        """
+        Clean up resources.
+        
+        Kept for API compatibility; the tool holds no resources of its own. The
+        HTTP client is shared across tools and is closed by the application via
+        close_shared_client(), not here.
+        """
 
 # Example usage
 if __name__ == "__main__":
@@ -189,7 +347,8 @@ if __name__ == "__main__":
                 print(f"Snippet: {result['snippet']}")
                 print(f"Source: {result['source']}")
         finally:
-            # Clean up
+            # Clean up, including the shared HTTP client if a real search created it
             await searcher.close()
+            await close_shared_client()
     
     asyncio.run(main())
@@ -6,7 +6,8 @@ performing web searches and processing the results.
 """
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 from core.types import WorkerType, WorkerResult, WorkerResponse
@@ -14,6 +15,9 @@ from tools.web_search_tool import WebSearchTool
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of successful responses kept in the per-worker LRU cache
+RESPONSE_CACHE_SIZE = 256
+
 @dataclass
 class SearchConfig:
     """Configuration for web search."""
@@ -41,6 +45,8 @@ class WebSearchWorker:
         """
         self.config = self._parse_config(config or {})
         self.search_tool = WebSearchTool(offline=True)
+        self._cache: "OrderedDict[Tuple, WorkerResponse]" = OrderedDict()
+        self._inflight: Dict[Tuple, "asyncio.Future[WorkerResponse]"] = {}
         
     def _parse_config(self, config: Dict[str, Any]) -> SearchConfig:
         """
@@ -59,10 +65,93 @@ class WebSearchWorker:
             search_language=config.get("search_language", "en")
         )
     
+    def _cache_key(self, query: str) -> Tuple:
+        """Build the response cache key for a query under the current config."""
+        return (
+            query,
+            self.config.num_results,
+            tuple(self.config.include_domains or ()),
+            tuple(self.config.exclude_domains or ()),
+        )
+    
     async def process(self, query: str, context: Optional[Dict[str, Any]] = None) -> WorkerResponse:
         """
         Process a search query and return results.
         
+        Successful responses are cached (LRU) per query, and concurrent
+        identical queries share a single in-flight search. Every caller gets
+        its own response and metadata dicts, so mutating a response never
+        affects the cache.
+        
+        Args:
+            query: The search query string
+            context: Optional context dictionary
+            
+        Returns:
+            WorkerResponse containing the search results or an error
+        """
+        key = self._cache_key(query)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return self._copy_response(cached)
+        
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._process_and_cache(key, query, context))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the search for the others
+        return self._copy_response(await asyncio.shield(inflight))
+    
+    @staticmethod
+    def _copy_response(response: WorkerResponse) -> WorkerResponse:
+        """
+        Copy a shared response for one caller.
+        
+        Only the metadata dicts (one level of nesting) are copied; content,
+        source and the values inside the metadata are immutable, so this stays
+        much cheaper than a deep copy or a fresh search.
+        """
+        result = response.result
+        if result is not None:
+            result = result.model_copy(update={
+                "metadata": {
+                    key: dict(value) if isinstance(value, dict) else value
+                    for key, value in result.metadata.items()
+                }
+            })
+        return WorkerResponse(success=response.success, result=result, error=response.error)
+    
+    async def _process_and_cache(
+        self,
+        key: Tuple,
+        query: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> WorkerResponse:
+        """
+        Run the search and store successful responses in the LRU cache.
+        
+        Args:
+            key: The response cache key
+            query: The search query string
+            context: Optional context dictionary
+            
+        Returns:
+            WorkerResponse containing the search results or an error
+        """
+        response = await self._process_uncached(query, context)
+        if response.success:
+            self._cache[key] = response
+            if len(self._cache) > RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return response
+    
+    async def _process_uncached(self, query: str, context: Optional[Dict[str, Any]] = None) -> WorkerResponse:
+        """
+        Perform the search and format the results, bypassing the cache.
+        
         Args:
             query: The search query string
             context: Optional context dictionary
@@ -96,15 +185,18 @@ class WebSearchWorker:
                 "query": query,
                 "config": {
                     "num_results": self.config.num_results,
-                    "include_domains": self.config.include_domains,
-                    "exclude_domains": self.config.exclude_domains,
+                    # Tuples, so copies of cached responses can share them
+                    "include_domains": tuple(self.config.include_domains or ()) or None,
+                    "exclude_domains": tuple(self.config.exclude_domains or ()) or None,
                     "search_language": self.config.search_language
                 }
             }
             
+            # content and source are str and metadata has str keys, so the result
+            # already matches WorkerResult's schema; skip re-validating it
             return WorkerResponse(
                 success=True,
-                result=WorkerResult(
+                result=WorkerResult.model_construct(
                     content=formatted_results,
                     metadata=metadata,
                     source=str(self.worker_type)
@@ -168,18 +260,22 @@ class WebSearchWorker:
         if not results:
             return "No search results found."
             
-        formatted = ["## Search Results\n"]
-        
-        for i, result in enumerate(results, 1):
-            formatted.append(f"### {i}. {result.get('title', 'No Title')}")
-            formatted.append(f"**URL:** {result.get('url', 'N/A')}")
-            formatted.append(f"**Snippet:** {result.get('snippet', 'No snippet available.')}")
-            formatted.append(f"**Source:** {result.get('source', 'unknown')}\n")
+        blocks = (
+            f"### {i}. {result.get('title', 'No Title')}\n"
+            f"**URL:** {result.get('url', 'N/A')}\n"
+            f"**Snippet:** {result.get('snippet', 'No snippet available.')}\n"
+            f"**Source:** {result.get('source', 'unknown')}\n"
+            for i, result in enumerate(results, 1)
+        )
         
-        return "\n".join(formatted)
+        return "## Search Results\n\n" + "\n".join(blocks)
     
     async def close(self):
-        """Clean up resources."""
+        """Clean up resources: cancel in-flight searches and drop cached responses."""
+        for inflight in list(self._inflight.values()):
+            inflight.cancel()
+        self._inflight.clear()
+        self._cache.clear()
         await self.search_tool.close()
 
 # Example usage